@@ -1,43 +1,174 @@
+import argparse
+import hashlib
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, ttk
+import io
 import json
 import os
+import threading
+import numpy as np
 import PyPDF2
 import re
+import string
+
+# Prefer PyMuPDF when installed: its native-code extractor is several times
+# faster than pure-Python PyPDF2 and preserves reading order better.
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
-# Set up logging
+# Set up logging. INFO by default; --debug raises the root level to DEBUG,
+# but the per-line debug output then goes to the log file only.
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.INFO)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('study_tracker.log'),
-        logging.StreamHandler()
+        _console_handler
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once at import time so the fallback parse avoids the re module's
+# per-call cache lookup.
+_ALT_HEADING_RE = re.compile(r'^\d+\.?\s+[A-Z]')
+
+# Line classes returned by PDFTopicExtractor._classify.
+_LINE_NONE, _LINE_SUBJECT, _LINE_SUBTOPIC = 0, 1, 2
+
+# First-character dispatch table: one dict lookup replaces the chain of
+# isupper/isdigit/membership checks that gated the regexes per line. Every
+# subject pattern starts with an ASCII uppercase letter or a digit; subtopic
+# patterns start with a digit, a bullet or an 'a)'-style lowercase marker
+# (leading whitespace is gated on the raw line separately).
+_SUBJECT_MAYBE, _SUBTOPIC_MAYBE = 1, 2
+_FIRST_CHAR_CLASS: Dict[str, int] = {}
+_FIRST_CHAR_CLASS.update({c: _SUBJECT_MAYBE for c in string.ascii_uppercase})
+_FIRST_CHAR_CLASS.update({c: _SUBJECT_MAYBE | _SUBTOPIC_MAYBE for c in string.digits})
+_FIRST_CHAR_CLASS.update({c: _SUBTOPIC_MAYBE for c in '-•●※*'})
+_FIRST_CHAR_CLASS.update({c: _SUBTOPIC_MAYBE for c in string.ascii_lowercase})
+
 class PDFTopicExtractor:
     """Handles PDF parsing and topic extraction."""
-    
-    SUBJECT_PATTERNS = [
+
+    SUBJECT_PATTERNS = (
         r'^Module\s+[IVX]+:?\s*\[\d+L\]',  # Matches "Module I: [10L]"
         r'^Module\s+\d+:?\s*\[\d+L\]',      # Matches "Module 1: [10L]"
         r'^[A-Z][A-Za-z\s\-]+:',            # Matches main topic headings with colon
         r'^[IVX]+\.',                        # Matches Roman numeral sections
         r'^\d+\.\s*[A-Z]'                   # Matches numbered sections
-    ]
-    
-    SUBTOPIC_PATTERNS = [
+    )
+
+    SUBTOPIC_PATTERNS = (
         r'^\s*[-•●※*]\s',                   # Bullet points
         r'^\s*[a-z]\)\s',                   # Matches a) b) c) style
         r'^\s*\d+\.\d*\s',                  # Numbered items
         r'^\s{2,}[A-Z][^:]+:',             # Indented topics with colon
         r'^\s{2,}[A-Z]',                   # Indented capitalized lines
-        r'(?<=:)([^,.]+)(?=[,.])'          # Captures items between colons and commas/periods
-    ]
+        r'(?<=:)(?:[^,.]+)(?=[,.])'        # Matches items between colons and commas/periods
+    )
+
+    # Single alternations so the regex engine tries every pattern in one call
+    # instead of one Python-level match() per pattern per line. No capture
+    # groups, so no mark-array allocation per match either.
+    _SUBJECT_RE = re.compile('|'.join(f'(?:{p})' for p in SUBJECT_PATTERNS))
+    _SUBTOPIC_RE = re.compile('|'.join(f'(?:{p})' for p in SUBTOPIC_PATTERNS))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify(line: str) -> int:
+        """Classify a raw line as _LINE_NONE, _LINE_SUBJECT or _LINE_SUBTOPIC.
+
+        Cached per unique line: repeated headers, footers and table-of-
+        contents entries skip the regex battery entirely. Takes the raw
+        (unstripped) line because the subtopic patterns depend on leading
+        indentation.
+        """
+        clean_line = line.strip()
+        if not clean_line:
+            return _LINE_NONE
+
+        # One table lookup gates the regexes: most lines match nothing, so
+        # skip the engine entirely when the first character rules out both
+        # a subject and a subtopic.
+        first_class = _FIRST_CHAR_CLASS.get(clean_line[0], 0)
+
+        if (first_class & _SUBJECT_MAYBE
+                and PDFTopicExtractor._SUBJECT_RE.match(clean_line)):
+            return _LINE_SUBJECT
+
+        is_subtopic = (
+            (line[:1] in ' \t' or first_class & _SUBTOPIC_MAYBE)
+            and PDFTopicExtractor._SUBTOPIC_RE.match(line) is not None
+        )
+        if is_subtopic or '  ' in line:
+            return _LINE_SUBTOPIC
+        return _LINE_NONE
     
+    @staticmethod
+    def _iter_lines(pdf_path: str) -> Iterator[str]:
+        """Yield text lines from each page of the PDF, in reading order.
+
+        Uses PyMuPDF when available and falls back to PyPDF2 otherwise.
+        """
+        # Dumping every page's raw text is by far the most expensive logging;
+        # only format and write it when DEBUG is actually enabled.
+        dump_pages = logger.isEnabledFor(logging.DEBUG)
+
+        if pymupdf is not None:
+            with pymupdf.open(pdf_path) as doc:
+                logger.debug("Number of pages: %d", len(doc))
+                for page_num, page in enumerate(doc):
+                    page_text = page.get_text('text')
+                    if dump_pages:
+                        logger.debug("\n--- Raw text from page %d ---\n%s\n-------------------", page_num + 1, page_text)
+                    yield from page_text.splitlines()
+            return
+
+        # PyPDF2 spends enough time outside the GIL that a thread pool gives
+        # real parallelism across pages. Readers are not thread-safe, so the
+        # file is read into memory once and each worker parses its own
+        # reader from the shared bytes.
+        with open(pdf_path, 'rb') as file:
+            data = file.read()
+
+        num_pages = len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+        logger.debug("Number of pages: %d", num_pages)
+
+        local = threading.local()
+
+        def extract_page(page_num: int) -> str:
+            try:
+                reader = getattr(local, 'reader', None)
+                if reader is None:
+                    reader = local.reader = PyPDF2.PdfReader(io.BytesIO(data))
+                return reader.pages[page_num].extract_text() or ''
+            except Exception as e:
+                logger.error(f"Error extracting text from page {page_num + 1}: {str(e)}")
+                return ''
+
+        if num_pages > 1:
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    page_texts = list(executor.map(extract_page, range(num_pages)))
+            except Exception as e:
+                logger.error(f"Parallel extraction failed, falling back to serial: {str(e)}")
+                page_texts = [extract_page(page_num) for page_num in range(num_pages)]
+        else:
+            page_texts = [extract_page(page_num) for page_num in range(num_pages)]
+
+        for page_num, page_text in enumerate(page_texts):
+            if dump_pages:
+                logger.debug("\n--- Raw text from page %d ---\n%s\n-------------------", page_num + 1, page_text)
+            yield from page_text.splitlines()
+
     @staticmethod
     def extract_topics_from_pdf(pdf_path: str) -> Dict[str, List[str]]:
         """
@@ -52,83 +183,79 @@ class PDFTopicExtractor:
         try:
             topics: Dict[str, List[str]] = {}
             current_subject: Optional[str] = None
-            
-            logger.debug(f"Opening PDF file: {pdf_path}")
-            with open(pdf_path, 'rb') as file:
-                try:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    logger.debug(f"Number of pages: {len(pdf_reader.pages)}")
-                    
-                    text = ''
-                    for page_num, page in enumerate(pdf_reader.pages):
-                        try:
-                            page_text = page.extract_text()
-                            logger.debug(f"\n--- Raw text from page {page_num + 1} ---\n{page_text}\n-------------------")
-                            text += page_text
-                        except Exception as e:
-                            logger.error(f"Error extracting text from page {page_num + 1}: {str(e)}")
-                    
-                    lines = text.split('\n')
-                    for line in lines:
-                        clean_line = line.strip()
-                        
-                        if not clean_line:
-                            continue
-                        
-                        # Check if line matches any subject pattern
-                        is_subject = any(re.match(pattern, clean_line) for pattern in PDFTopicExtractor.SUBJECT_PATTERNS)
-                        if is_subject:
-                            current_subject = clean_line
-                            topics[current_subject] = []
-                            logger.debug(f"Found subject: {current_subject}")
-                            continue
-                        
-                        # Check if line matches any subtopic pattern
-                        is_subtopic = any(re.match(pattern, line) for pattern in PDFTopicExtractor.SUBTOPIC_PATTERNS)
-                        if current_subject is not None and (is_subtopic or '  ' in line):
-                            subtopic = re.sub(r'^\s*[-•●※*\d.]\s*', '', clean_line)
-                            if subtopic and len(subtopic.strip()) > 0:
-                                topics[current_subject].append(subtopic.strip())
-                                logger.debug(f"Added subtopic to {current_subject}: {subtopic}")
-                    
-                    # Remove empty subjects and try alternative parsing if needed
-                    topics = PDFTopicExtractor._clean_and_validate_topics(topics, lines)
-                    return topics
-                    
-                except Exception as e:
-                    logger.error(f"Error reading PDF: {str(e)}")
-                    messagebox.showerror("Error", f"Failed to read PDF: {str(e)}")
-                    return {"Error": ["Failed to read PDF"]}
-                    
-        except Exception as e:
+
+            logger.debug("Opening PDF file: %s", pdf_path)
+            # Stream lines straight off each page rather than building one
+            # giant document string; the stripped non-empty lines are kept
+            # with their classification so the fallback parse can reuse the
+            # scan instead of re-stripping and re-classifying everything.
+            scanned: List[Tuple[str, int]] = []
+            found_subtopic = False
+            for line in PDFTopicExtractor._iter_lines(pdf_path):
+                clean_line = line.strip()
+
+                if not clean_line:
+                    continue
+
+                line_class = PDFTopicExtractor._classify(line)
+                scanned.append((clean_line, line_class))
+                if line_class == _LINE_SUBJECT:
+                    current_subject = clean_line
+                    topics[current_subject] = []
+                    logger.debug("Found subject: %s", current_subject)
+                elif line_class == _LINE_SUBTOPIC and current_subject is not None:
+                    # lstrip with a plain character set beats a regex sub for
+                    # peeling bullets and list numbers off the front.
+                    subtopic = clean_line.lstrip('-•●※*0123456789. \t')
+                    if not subtopic:
+                        # Purely numeric subtopics like '- 1995' would strip
+                        # to nothing; peel only the bullet markers for those.
+                        subtopic = clean_line.lstrip('-•●※* \t')
+                    if subtopic:
+                        topics[current_subject].append(subtopic)
+                        found_subtopic = True
+                        logger.debug("Added subtopic to %s: %s", current_subject, subtopic)
+
+            # Remove empty subjects and try alternative parsing if needed
+            topics = PDFTopicExtractor._clean_and_validate_topics(topics, scanned, found_subtopic)
+            return topics
+
+        except OSError as e:
             logger.error(f"Error opening file: {str(e)}")
             messagebox.showerror("Error", f"Failed to open file: {str(e)}")
             return {"Error": ["Failed to open file"]}
+        except Exception as e:
+            logger.error(f"Error reading PDF: {str(e)}")
+            messagebox.showerror("Error", f"Failed to read PDF: {str(e)}")
+            return {"Error": ["Failed to read PDF"]}
     
     @staticmethod
-    def _clean_and_validate_topics(topics: Dict[str, List[str]], lines: List[str]) -> Dict[str, List[str]]:
-        """Clean up and validate extracted topics, attempting alternative parsing if needed."""
+    def _clean_and_validate_topics(topics: Dict[str, List[str]], scanned: List[Tuple[str, int]],
+                                   found_subtopic: bool) -> Dict[str, List[str]]:
+        """Clean up and validate extracted topics, attempting alternative parsing if needed.
+
+        `scanned` holds the (clean_line, line_class) pairs collected by the
+        primary pass, so nothing is re-stripped or re-classified here;
+        `found_subtopic` short-circuits the fallback when the primary pass
+        already produced at least one subtopic.
+        """
         # Remove empty subjects
         topics = {k: v for k, v in topics.items() if v}
-        
+
         # If no topics found, try alternative parsing
-        if not topics:
+        if not found_subtopic:
             logger.debug("No topics found with primary patterns, trying alternative parsing...")
             current_subject = None
-            for line in lines:
-                clean_line = line.strip()
-                if not clean_line:
-                    continue
-                
+            for clean_line, _ in scanned:
                 if (len(clean_line) > 3 and (
-                    clean_line.isupper() or 
+                    clean_line.isupper() or
                     clean_line.endswith(':') or
-                    re.match(r'^\d+\.?\s+[A-Z]', clean_line))):
+                    _ALT_HEADING_RE.match(clean_line))):
                     current_subject = clean_line
                     topics[current_subject] = []
-                elif current_subject and clean_line:
+                elif current_subject:
                     topics[current_subject].append(clean_line)
-        
+
         # If still no topics found, create a default section
         if not topics:
             logger.warning("No topics found in PDF")
@@ -137,56 +264,68 @@ class PDFTopicExtractor:
                 "Could not detect topics in the PDF. The file might be scanned or in a format that's hard to parse. "
                 "Try a different PDF or check the file format."
             )
-            topics["Detected Content"] = [line.strip() for line in lines if line.strip()][:10]
-        
+            topics["Detected Content"] = [clean_line for clean_line, _ in scanned[:10]]
+
         return topics
 
 class StudyTracker:
     """Main application class for the Study Plan Progress Tracker."""
-    
+
+    CHECKED = '☑'
+    UNCHECKED = '☐'
+
+    # Longest topic list shown in the progress report; the rest is summarized
+    # so the messagebox never has to lay out thousands of lines.
+    MAX_REPORT_ITEMS = 25
+
     def __init__(self):
         """Initialize the application and set up the UI."""
         self.app = tk.Tk()
         self.app.title("Study Plan Progress Tracker")
         self.app.geometry("800x600")
-        
+
         self._setup_ui()
         self.topics: Dict[str, List[str]] = {}
-        self.checkbox_vars: Dict[str, tk.BooleanVar] = {}
-        
+        # Structure-of-arrays model behind the Treeview: topic names in
+        # insertion order, check state as one uint8 per topic. Counting and
+        # serializing become vectorized NumPy reductions instead of a Python
+        # loop over per-topic objects.
+        self._topic_names: List[str] = []
+        self._done = np.zeros(0, dtype=np.uint8)
+        self._topic_index: Dict[str, int] = {}  # topic -> array index
+        self._item_ids: List[str] = []          # array index -> tree item id
+        self._item_index: Dict[str, int] = {}   # tree item id -> array index
+        self._last_saved_bits: Optional[int] = None
+
     def _setup_ui(self):
         """Set up the user interface components."""
         # Main frame with scrollbar
         self.main_frame = tk.Frame(self.app)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Canvas and scrollbar setup
-        self.canvas = tk.Canvas(self.main_frame)
-        self.scrollbar = tk.Scrollbar(self.main_frame, orient=tk.VERTICAL, command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas)
-        
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        
+
+        # A single Treeview replaces one Checkbutton widget per subtopic:
+        # subjects are parent rows, subtopics child rows with a checkbox
+        # column rendered as a unicode glyph.
+        self.tree = ttk.Treeview(self.main_frame, columns=('done',), selectmode='none')
+        self.tree.heading('#0', text='Topic')
+        self.tree.heading('done', text='Done')
+        self.tree.column('done', width=60, anchor='center', stretch=False)
+        self.tree.bind('<Button-1>', self._on_tree_click)
+
+        self.scrollbar = ttk.Scrollbar(self.main_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
         # Pack scrollbar components
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
         # Buttons frame
         self.buttons_frame = tk.Frame(self.app)
         self.buttons_frame.pack(pady=10)
-        
+
         # Add buttons
         self._create_buttons()
-        
-        # Enable mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-    
+
     def _create_buttons(self):
         """Create and configure the application buttons."""
         buttons = [
@@ -198,18 +337,28 @@ class StudyTracker:
         for text, command in buttons:
             tk.Button(self.buttons_frame, text=text, command=command).pack(side=tk.LEFT, padx=5)
     
-    def _on_mousewheel(self, event):
-        """Handle mousewheel scrolling."""
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-    
+    def _on_tree_click(self, event):
+        """Toggle the checkbox of the clicked subtopic row."""
+        item = self.tree.identify_row(event.y)
+        index = self._item_index.get(item)
+        if index is None:
+            return
+        self._set_topic_state(index, not self._done[index])
+
+    def _set_topic_state(self, index: int, is_completed: bool):
+        """Update a topic's check state and its checkbox glyph."""
+        self._done[index] = is_completed
+        self.tree.set(self._item_ids[index], 'done',
+                      self.CHECKED if is_completed else self.UNCHECKED)
+
     def load_pdf(self):
         """Load and process a PDF file."""
         pdf_path = filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
         if pdf_path:
-            logger.debug(f"Selected PDF file: {pdf_path}")
+            logger.debug("Selected PDF file: %s", pdf_path)
             self.topics = PDFTopicExtractor.extract_topics_from_pdf(pdf_path)
             if self.topics:
-                logger.debug(f"Extracted topics: {list(self.topics.keys())}")
+                logger.debug("Extracted topics: %s", list(self.topics.keys()))
                 self.refresh_ui()
             else:
                 logger.error("No topics extracted from PDF")
@@ -218,33 +367,66 @@ class StudyTracker:
     def refresh_ui(self):
         """Refresh the UI with current topics and load saved progress."""
         # Clear existing UI
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
+        self.tree.delete(*self.tree.get_children())
+        self._topic_names.clear()
+        self._topic_index.clear()
+        self._item_ids.clear()
+        self._item_index.clear()
+
+        # The skip-if-unchanged key in _write_progress is only valid for the
+        # topic list it was computed against; forget it when the list changes.
+        self._last_saved_bits = None
+
         logger.debug("Refreshing UI with topics")
-        # Create frames for each subject
+        # Create rows for each subject
         for subject, items in self.topics.items():
-            self._create_subject_frame(subject, items)
-        
+            self._create_subject_rows(subject, items)
+        self._done = np.zeros(len(self._topic_names), dtype=np.uint8)
+
         self.load_progress()
-    
-    def _create_subject_frame(self, subject: str, items: List[str]):
-        """Create a frame for a subject and its subtopics."""
-        frame = tk.LabelFrame(self.scrollable_frame, text=subject, padx=10, pady=10)
-        frame.pack(padx=10, pady=5, fill="x", expand=True)
-        
+
+    def _create_subject_rows(self, subject: str, items: List[str]):
+        """Insert a subject row and its subtopic rows into the tree."""
+        parent = self.tree.insert('', tk.END, text=subject, open=True)
         for item in items:
-            var = tk.BooleanVar()
-            checkbox = tk.Checkbutton(frame, text=item, variable=var, wraplength=600)
-            checkbox.pack(anchor="w")
-            self.checkbox_vars[item] = var
-    
+            item_id = self.tree.insert(parent, tk.END, text=item,
+                                       values=(self.UNCHECKED,))
+            self._topic_index[item] = len(self._topic_names)
+            self._topic_names.append(item)
+            self._item_index[item_id] = len(self._item_ids)
+            self._item_ids.append(item_id)
+
+    def _topics_hash(self) -> str:
+        """Stable fingerprint of the topic list, in bit-index order."""
+        return hashlib.md5('\n'.join(self._topic_names).encode('utf-8')).hexdigest()
+
+    def _write_progress(self):
+        """Serialize checkbox state to progress.json as a compact bitset.
+
+        Each topic gets a stable bit index from its insertion order, so the
+        file holds one hex string instead of one JSON entry per topic. The
+        bitset comes straight out of the uint8 state array via packbits. A
+        fingerprint of the topic list rides along so the bits are never
+        applied to a different syllabus on load.
+        """
+        packed = np.packbits(self._done, bitorder='little')
+        bits = int.from_bytes(packed.tobytes(), 'little')
+        if bits == self._last_saved_bits:
+            # Nothing changed since the last save; skip the I/O entirely.
+            return
+        # Write to a temp file and rename so a crash mid-write can never
+        # leave a truncated progress.json behind.
+        with open('progress.json.tmp', 'w') as f:
+            json.dump({'version': 2, 'bits': format(bits, 'x'),
+                       'topics_hash': self._topics_hash()}, f,
+                      separators=(',', ':'))
+        os.replace('progress.json.tmp', 'progress.json')
+        self._last_saved_bits = bits
+
     def save_progress(self):
         """Save current progress to a JSON file."""
         try:
-            progress = {key: var.get() for key, var in self.checkbox_vars.items()}
-            with open('progress.json', 'w') as f:
-                json.dump(progress, f)
+            self._write_progress()
             logger.debug("Progress saved successfully")
             messagebox.showinfo("Success", "Progress saved successfully!")
         except Exception as e:
@@ -257,29 +439,70 @@ class StudyTracker:
             if os.path.exists('progress.json'):
                 with open('progress.json', 'r') as f:
                     progress = json.load(f)
+                if progress.get('version') == 2:
+                    if progress.get('topics_hash') != self._topics_hash():
+                        # Saved from a different topic list; the bits are
+                        # keyed by insertion index and would check the
+                        # wrong topics. Leave everything unchecked.
+                        logger.info("Saved progress belongs to a different syllabus; ignoring it")
+                        return
+                    bits = int(progress.get('bits') or '0', 16)
+                    self._last_saved_bits = bits
+                    # Unpack the bitset into the uint8 array in one shot;
+                    # the tree is freshly built, so only set bits need a
+                    # glyph update.
+                    n = self._done.size
+                    # A stale file can carry more bits than we have topics;
+                    # size the buffer for whichever is larger and let count=n
+                    # drop the excess.
+                    n_bytes = max((n + 7) // 8, (bits.bit_length() + 7) // 8, 1)
+                    raw = bits.to_bytes(n_bytes, 'little')
+                    done = np.unpackbits(np.frombuffer(raw, dtype=np.uint8),
+                                         bitorder='little', count=n)
+                    for index in np.flatnonzero(done):
+                        self._set_topic_state(int(index), True)
+                else:
+                    # Legacy format: one topic -> bool entry per topic.
+                    # Apply it once and migrate the file to the bitset.
                     for topic, is_completed in progress.items():
-                        if topic in self.checkbox_vars:
-                            self.checkbox_vars[topic].set(is_completed)
+                        index = self._topic_index.get(topic)
+                        if index is not None:
+                            self._set_topic_state(index, bool(is_completed))
+                    self._write_progress()
                 logger.debug("Progress loaded successfully")
         except Exception as e:
             logger.error(f"Error loading progress: {str(e)}")
             messagebox.showerror("Error", f"Failed to load progress: {str(e)}")
     
+    @classmethod
+    def _format_topic_list(cls, topics: List[str]) -> str:
+        """Format topics as bullet lines, truncated to MAX_REPORT_ITEMS."""
+        shown = topics[:cls.MAX_REPORT_ITEMS]
+        # Joining onto a leading empty string bullets every item with a
+        # single join call -- no per-item f-string allocation.
+        text = '\n• '.join([''] + shown)
+        remaining = len(topics) - len(shown)
+        if remaining > 0:
+            text += f"\n... and {remaining} more"
+        return text
+
     def check_progress(self):
         """Generate and display a progress report."""
-        completed = [key for key, var in self.checkbox_vars.items() if var.get()]
-        incomplete = [key for key, var in self.checkbox_vars.items() if not var.get()]
-        
-        total = len(completed) + len(incomplete)
+        # Vectorized reductions over the uint8 state array replace the
+        # Python loop over per-topic state.
+        total = self._done.size
         if total > 0:
-            completion_rate = (len(completed) / total) * 100
-            message = (
-                f"Progress: {completion_rate:.1f}%\n\n"
-                f"Completed Topics ({len(completed)}):\n"
-                + "\n".join(f"• {topic}" for topic in completed)
-                + f"\n\nIncomplete Topics ({len(incomplete)}):\n"
-                + "\n".join(f"• {topic}" for topic in incomplete)
-            )
+            completed_count = int(self._done.sum())
+            completion_rate = (completed_count / total) * 100
+            completed = [self._topic_names[i] for i in np.flatnonzero(self._done)]
+            incomplete = [self._topic_names[i] for i in np.flatnonzero(self._done == 0)]
+            message = ''.join([
+                f"Progress: {completion_rate:.1f}%\n\n",
+                f"Completed Topics ({len(completed)}):",
+                self._format_topic_list(completed),
+                f"\n\nIncomplete Topics ({len(incomplete)}):",
+                self._format_topic_list(incomplete),
+            ])
         else:
             message = "No topics available. Please load a PDF first."
         
@@ -291,5 +514,12 @@ class StudyTracker:
         self.app.mainloop()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Study Plan Progress Tracker")
+    parser.add_argument('--debug', action='store_true',
+                        help='enable verbose debug logging (written to study_tracker.log)')
+    args = parser.parse_args()
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     app = StudyTracker()
     app.run()